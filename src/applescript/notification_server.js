@@ -0,0 +1,32 @@
+// 標準入力から "message\x1ftitle\n" 形式の行を受け取り、EOFまで通知を表示し続ける
+ObjC.import("Foundation");
+
+function run() {
+    const app = Application.currentApplication();
+    app.includeStandardAdditions = true;
+
+    const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+    const pending = $.NSMutableData.data;
+    let buffer = "";
+
+    for (;;) {
+        const data = stdin.availableData;
+        if (data.length === 0) {
+            break;
+        }
+        pending.appendData(data);
+        const text = $.NSString.alloc.initWithDataEncoding(pending, $.NSUTF8StringEncoding);
+        if (text.isNil()) {
+            continue; // マルチバイト文字の途中で分割された場合は残りを待つ
+        }
+        pending.setLength(0);
+        buffer += text.js;
+
+        let newline;
+        while ((newline = buffer.indexOf("\n")) !== -1) {
+            const [message, title] = buffer.slice(0, newline).split("\x1f");
+            buffer = buffer.slice(newline + 1);
+            app.displayNotification(message, { withTitle: title, soundName: "Submarine" });
+        }
+    }
+}
@@ -16,12 +16,19 @@ class AppConstant(StrictConstant):
     Attributes:
         CHECK_INTERVAL (int): Normal check interval (seconds).
         STREAMING_INTERVAL (int): Check interval when streaming (seconds).
+        MAX_BACKOFF_INTERVAL (int): Maximum check interval while requests keep failing (seconds),
+            unless Ratelimit-Reset asks for a longer wait.
         TIMEOUT_SECONDS (int): Timeout seconds for requests.
+        CONNECTION_LIMIT (int): Maximum number of simultaneous connections to the Twitch API.
+        DNS_CACHE_TTL_SECONDS (int): Seconds to cache resolved DNS entries.
+        KEEPALIVE_TIMEOUT_SECONDS (int): Seconds to keep an idle connection open for reuse.
         GRANT_TYPE (str): Grant type for the Twitch API.
         ERROR_SESSION_NOT_INITIALIZED (str): Error message for uninitialized session.
         ERROR_ACCESS_TOKEN_NOT_AVAILABLE (str): Error message for unavailable access token.
         ERROR_ACCESS_TOKEN_FAILED (str): Error message for failed access token retrieval.
         ERROR_API_REQUEST_FAILED (str): Error message for failed API requests.
+        ERROR_API_REQUEST_TIMEOUT (str): Error message for timed out API requests.
+        ERROR_RATE_LIMITED (str): Error message for rate limited API requests.
         STYLE (dict): Style settings for the interactive interface.
         CUSTOM_STYLE (InquirerPyStyle): Custom style for the interactive interface.
         LOG_FORMAT (str): Log format.
@@ -30,8 +37,12 @@ class AppConstant(StrictConstant):
     # Twitch API関連
     CHECK_INTERVAL: int = 60  # 通常の確認間隔（秒）
     STREAMING_INTERVAL: int = 3600  # 配信中の確認間隔（秒）
+    MAX_BACKOFF_INTERVAL: int = 900  # エラー時の確認間隔の上限（秒）
 
     TIMEOUT_SECONDS: int = 10
+    CONNECTION_LIMIT: int = 10
+    DNS_CACHE_TTL_SECONDS: int = 300
+    KEEPALIVE_TIMEOUT_SECONDS: int = CHECK_INTERVAL + 15  # 確認間隔をまたいで接続を再利用する
     GRANT_TYPE: str = "client_credentials"
 
     # エラーメッセージの定義
@@ -39,6 +50,8 @@ class AppConstant(StrictConstant):
     ERROR_ACCESS_TOKEN_NOT_AVAILABLE: str = "Access token not available" # noqa: S105
     ERROR_ACCESS_TOKEN_FAILED: str = "Failed to get access token" # noqa: S105
     ERROR_API_REQUEST_FAILED: str = "API request failed"
+    ERROR_API_REQUEST_TIMEOUT: str = "API request timed out"
+    ERROR_RATE_LIMITED: str = "API rate limit exceeded"
 
     STYLE: dict = {
         "questionmark": "#a7e22e bold",  # ?マークの色
@@ -10,6 +10,7 @@ which monitors the streaming status of a Twitch streamer and provides notificati
 import asyncio
 import contextlib
 import os
+import signal
 import subprocess
 import sys
 import termios
@@ -38,20 +39,25 @@ class StreamNotification(object):
     Attributes:
         base_dir (Path): The base directory of the application
         twitch_api (TwitchAPI): The Twitch API client
-        is_running (bool): The running status of the application
-        _cleanup_tasks (list[asyncio.Task]): The cleanup tasks
         cleanup_compelete_event (asyncio.Event): The cleanup complete event
+        _notification_script (Path): The path to the notification server script
+        _notifier (asyncio.subprocess.Process | None): The long-lived osascript process displaying notifications
+        _dialog_script (Path): The path to the dialog AppleScript
+        _starting_dialog_script (Path): The path to the starting dialog AppleScript
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize instancee of StreamNotification
         """
         self.base_dir = get_base_path()
         self.twitch_api = TwitchAPI()
-        self.is_running = True
-        self._cleanup_tasks: list[asyncio.Task] = []
         self.cleanup_complete_event = asyncio.Event()
         self.terminal = Terminal(self.base_dir)
+        script_dir = Path(self.base_dir, "applescript")
+        self._notification_script = script_dir / "notification_server.js"
+        self._dialog_script = script_dir / "dialog.applescript"
+        self._starting_dialog_script = script_dir / "starting_dialog.applescript"
+        self._notifier: asyncio.subprocess.Process | None = None
 
     @asynccontextmanager
     async def initialize(self) -> AsyncIterator["StreamNotification"]:
@@ -60,19 +66,46 @@ class StreamNotification(object):
         Yields:
             StreamNotification: The StreamNotification instance
         """
+        # 入力を待つ間に通知用プロセスを起動しておく(スクリプトの有無は形式の選択後に確認する)
+        if self._notification_script.exists():
+            await self._start_notifier()
         await self.twitch_api.initialize()
         yield self
 
-    async def display_message(self, message: str) -> None:
+    def scripts_available(self, display_format: NotificationFormat) -> bool:
+        """Check that the scripts used by the display format exist
+
+        Args:
+            display_format (NotificationFormat): The display format to use
+
+        Returns:
+            bool: True if all required scripts exist, False otherwise
+        """
+        if display_format == NotificationFormat.NOTIFICATION:
+            required_scripts = [self._notification_script]
+        else:
+            required_scripts = [self._dialog_script, self._starting_dialog_script]
+        missing_scripts = [script_path for script_path in required_scripts if not script_path.exists()]
+        for script_path in missing_scripts:
+            logger.error("Script not found: %s", script_path)
+        return not missing_scripts
+
+    def display_message(self, message: str) -> None:
         """Display a message to the user"""
         print(message)
-        await asyncio.sleep(0)
 
-    def format_display_message(self, username: str, display_name: str, stream_title: str) -> str:
+    def format_display_message(
+        self,
+        username: str,
+        casefolded_username: str,
+        display_name: str,
+        stream_title: str
+    ) -> str:
         """Formats the message to be displayed
 
         Args:
-            username (str): The username of the streamer
+            username (str): The username of the streamer as entered
+            casefolded_username (str): The casefolded username, used only for the comparison
             display_name (str): The display name of the streamer
             stream_title (str): The title of the stream
 
@@ -80,47 +113,72 @@ class StreamNotification(object):
             str: The formatted message
 
         Example:
-            >>> format_display_message("username", "display_name", "stream_title")
-            "display_name has started streaming: stream_title"
+            >>> format_display_message("UserName", "username", "USERNAME", "stream_title")
+            "USERNAME has started streaming: stream_title"
+            >>> format_display_message("username", "username", "display_name", "stream_title")
+            "display_name(username) has started streaming: stream_title"
         """
         base_format = f" has started streaming: {stream_title}"
-        if username.lower() == display_name.lower():
+        if casefolded_username == display_name.casefold():
             return display_name + base_format
         return f"{display_name}({username})" + base_format
 
-    async def _run_notification_script(self, message: str, title: str) -> None:
-        """Run the notification AppleScript to display a notification
+    async def _start_notifier(self) -> None:
+        """Start the osascript process that displays notifications read from its stdin
 
-        Args:
-            message (str): The message to display
-            title (str): The title of the notification
+        Keeping one process alive avoids spawning osascript and compiling the script for every notification.
 
         Raises:
-            subprocess.SubprocessError: An error occurred while running the script
-            FileNotFoundError: The script was not found
+            subprocess.SubprocessError: An error occurred while starting the script
         """
         try:
-            script_path = Path(self.base_dir, "applescript", "notification.applescript")
-        except FileNotFoundError:
+            self._notifier = await asyncio.create_subprocess_exec(
+                "/usr/bin/osascript",
+                "-l",
+                "JavaScript",
+                self._notification_script,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except subprocess.SubprocessError:
             logger.exception(traceback.format_exc())
+            self._notifier = None
+
+    async def _stop_notifier(self) -> None:
+        """Stop the notification process by closing its stdin"""
+        if self._notifier is None:
+            return
+        if self._notifier.stdin and self._notifier.returncode is None:
+            self._notifier.stdin.close()
+            with contextlib.suppress(ConnectionResetError, BrokenPipeError):
+                await self._notifier.stdin.wait_closed()
+        await self._notifier.wait()
+        self._notifier = None
+
+    async def _run_notification_script(self, message: str, title: str) -> None:
+        """Send a notification to the notification process, restarting it if it has exited
+
+        Args:
+            message (str): The message to display
+            title (str): The title of the notification
+        """
+        if self._notifier is None or self._notifier.returncode is not None:
+            await self._start_notifier()
+        if self._notifier is None or self._notifier.stdin is None:
             return
 
-        script_arguments = [message, title]
+        # 1行1通知で送るため、区切り文字と改行は空白に置き換える
+        fields = (field.replace("\n", " ").replace("\x1f", " ") for field in (message, title))
+        line = "\x1f".join(fields) + "\n"
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "/usr/bin/osascript",
-                script_path,
-                *script_arguments,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await proc.communicate()
-        except subprocess.SubprocessError:
+            self._notifier.stdin.write(line.encode())
+            await self._notifier.stdin.drain()
+        except (ConnectionResetError, BrokenPipeError):
             logger.exception(traceback.format_exc())
             return
 
-
     async def _run_dialog_script(self, message: str, title: str, a_url: urllib3.util.Url) -> None:
         """Run to display a dialogue Applescript informing that the monitored object has started a stream
 
@@ -131,14 +189,7 @@ class StreamNotification(object):
 
         Raises:
             subprocess.SubprocessError: An error occurred while running the script
-            FileNotFoundError: The script was not found
         """
-        try:
-            script_path = Path(self.base_dir, "applescript", "dialog.applescript")
-        except FileNotFoundError:
-            logger.exception(traceback.format_exc())
-            return
-
         filename = getattr(self, "downloaded_profile_image_name", None) or "profile_image.png"
         icon_full_path = os.path.join(
             self.base_dir.parent.as_posix(),
@@ -150,12 +201,12 @@ class StreamNotification(object):
         try:
             proc = await asyncio.create_subprocess_exec(
                 "/usr/bin/osascript",
-                script_path,
+                self._dialog_script,
                 *script_arguments,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            await proc.communicate()
+            await proc.wait()
         except subprocess.SubprocessError:
             logger.exception(traceback.format_exc())
             return
@@ -170,56 +221,49 @@ class StreamNotification(object):
 
         Raises:
             subprocess.SubprocessError: An error occurred while running the script
-            FileNotFoundError: The script was not found
         """
-        try:
-            script_path = Path(self.base_dir, "applescript", "starting_dialog.applescript")
-        except FileNotFoundError:
-            logger.exception(traceback.format_exc())
-            return
-
         script_arguments = [message, title, icon_full_path]
 
         try:
             proc = await asyncio.create_subprocess_exec(
                 "/usr/bin/osascript",
-                script_path,
+                self._starting_dialog_script,
                 *script_arguments,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            await proc.communicate()
+            await proc.wait()
         except subprocess.SubprocessError:
             logger.exception(traceback.format_exc())
             return
 
-    async def check_stream_status(self, username: str, display_format: NotificationFormat) -> None:
+    async def check_stream_status(self, username: str, broadcaster_id: str, display_format: NotificationFormat) -> None:
         """Check the streaming status of a streamer
 
         Args:
             username (str): The username of the streamer
+            broadcaster_id (str): The broadcaster ID of the streamer
             display_format (str): The display format to use
 
         Raises:
             TwitchAPIError: An error occurred while checking the stream status
         """
-        while self.is_running:
-            display_name, stream_title = await self.twitch_api.get_stream_by_name(username)
-
-            if display_name and stream_title:
-                url_string = f"https://www.twitch.tv/{username}"
-                a_url: urllib3.util.Url = urllib3.util.parse_url(url_string)
-                message = self.format_display_message(username, display_name, stream_title)
-                notification_title = "Stream Started"
-                if display_format == NotificationFormat.NOTIFICATION:
-                    await self._run_notification_script(message, notification_title)
-                else:
-                    await self._run_dialog_script(message, notification_title, a_url)
-                await asyncio.sleep(AppConstant.STREAMING_INTERVAL)
+        # 監視中は変わらないため、ループの外で一度だけ求めておく
+        casefolded_username = username.casefold()
+        url_string = f"https://www.twitch.tv/{username}"
+        a_url: urllib3.util.Url = urllib3.util.parse_url(url_string)
+
+        async for display_name, stream_title in self.twitch_api.stream_events(broadcaster_id):
+            message = self.format_display_message(
+                username, casefolded_username, display_name, stream_title
+            )
+            notification_title = "Stream Started"
+            if display_format == NotificationFormat.NOTIFICATION:
+                await self._run_notification_script(message, notification_title)
             else:
-                await asyncio.sleep(AppConstant.CHECK_INTERVAL)
+                await self._run_dialog_script(message, notification_title, a_url)
 
-    async def check_streamer_existence(self, username: str, display_format: NotificationFormat) -> bool:
+    async def check_streamer_existence(self, username: str, display_format: NotificationFormat) -> str | None:
         """Check if the streamer exists
 
         Args:
@@ -227,19 +271,19 @@ class StreamNotification(object):
             display_format (str): The display format to use
 
         Returns:
-            bool: True if the streamer exists, False otherwise
+            str | None: The broadcaster ID if the streamer exists, None otherwise
 
         Raises:
             TwitchAPIError: An error occurred while checking the streamer
         """
-        await self.display_message("Please wait a moment.")
+        self.display_message("Please wait a moment.")
 
         resources_dir = Path(os.path.join(self.base_dir.parent.as_posix(), "Resources"))
         result = await self.twitch_api.get_broadcaster_id(username, resources_dir)
         if not result or not result[0]:
             message = f"{username} not found."
-            await self.display_message(message)
-            return False
+            self.display_message(message)
+            return None
 
         broadcaster_id, image_filename = result
         image_filename = image_filename or "profile_image.png"
@@ -254,33 +298,22 @@ class StreamNotification(object):
             icon_path = os.path.join(resources_dir.as_posix(), image_filename)
             await self._run_starting_dialog_script(message, found_title, icon_path)
 
-        await self.display_message(message)
+        self.display_message(message)
         how_to_quit = "Type [q] to quit the application."
-        await self.display_message(how_to_quit)
-        return True
+        self.display_message(how_to_quit)
+        return broadcaster_id
 
     async def cleanup(self) -> None:
         """Clean up the application
 
-        This method cancels all running tasks, closes the Twitch API client, and sets the cleanup complete event.
-
-        Raises:
-            asyncio.CancelledError: The task was cancelled
+        This method closes the Twitch API client and the notification process, and sets the cleanup complete event.
+        The monitoring tasks have already been awaited by the TaskGroup in monitor_stream().
         """
-        if not self.is_running:
-            return
         logger.info("Starting application cleanup...")
-        self.is_running = False
-
-        # 実行中のタスクをキャンセル
-        for task in self._cleanup_tasks:
-            if not task.done():
-                task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await task
 
         # Twitchクライアントのクリーンアップ
         await self.twitch_api.close()
+        await self._stop_notifier()
 
         try:
             if hasattr(self, "downloaded_profile_image_name"):
@@ -294,18 +327,16 @@ class StreamNotification(object):
         logger.info("Application cleanup completed")
         self.cleanup_complete_event.set()
 
-
-    def handle_signal(self, _sig: int, _frame: object | None) -> None:
-        """Handle incoming signals and initiate application shutdown
+    def request_shutdown(self, *tasks: asyncio.Task) -> None:
+        """Handle SIGINT/SIGTERM by cancelling the monitoring tasks
 
         Args:
-            _sig (int): The signal number
-            _frame (object | None): The frame object
+            *tasks (asyncio.Task): The tasks to cancel
         """
         print("\nPlease wait a moment, terminating the application...")
         print("Do not change the currently selected tab in the terminal.")
-        loop = asyncio.get_event_loop()
-        loop.create_task(self.cleanup())
+        for task in tasks:
+            task.cancel()
 
     async def input_monitoring_settings(self) -> tuple[str, "NotificationFormat"]:
         """Prompt the user for monitoring settings
@@ -332,28 +363,59 @@ class StreamNotification(object):
         return username, display_format # type: ignore
 
     async def listen_for_quit(self) -> None:
-        """This method listens for the 'q' keypress and triggers the cleanup process when detected.
+        """This method listens for the 'q' keypress and returns when detected.
 
-        Raises:
-            EOFError: If the input stream is closed
-            KeyboardInterrupt: If the input stream is interrupted
+        Listening also stops when the input stream is closed.
         """
-        def _read_char() -> str:
-            # 標準入力の設定を保存
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setraw(sys.stdin.fileno()) # 標準入力を非カノニカルモードに設定
-                return sys.stdin.read(1)
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings) # 標準入力の設定を元に戻す
+        loop = asyncio.get_running_loop()
+        stdin_fd = sys.stdin.fileno()
+        keypresses: asyncio.Queue[bytes] = asyncio.Queue()
+
+        # 標準入力の設定を保存
+        old_settings = termios.tcgetattr(stdin_fd)
+        # Ctrl+CでSIGINTが届くよう、rawではなくcbreakで非カノニカルモードに設定
+        tty.setcbreak(stdin_fd)
+        # スレッドでreadをブロックさせず、入力可能になった時だけイベントループから読み取る
+        loop.add_reader(stdin_fd, lambda: keypresses.put_nowait(os.read(stdin_fd, 1)))
+        try:
+            while True:
+                key = await keypresses.get()
+                if not key: # EOF
+                    break
+                if key.lower() == b"q":
+                    print("\nQuit command received. Terminating application...")
+                    break
+        finally:
+            loop.remove_reader(stdin_fd)
+            termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_settings) # 標準入力の設定を元に戻す
+
+    async def monitor_stream(self, username: str, broadcaster_id: str, display_format: NotificationFormat) -> None:
+        """Monitor the stream until 'q' is pressed, a shutdown signal is received or a task fails
 
-        loop = asyncio.get_event_loop()
-        while self.is_running:
-            char = await loop.run_in_executor(None, _read_char)
-            if char.lower() == "q":
-                print("\nQuit command received. Terminating application...")
-                await self.cleanup()
-                break
+        Args:
+            username (str): The username of the streamer
+            broadcaster_id (str): The broadcaster ID of the streamer
+            display_format (NotificationFormat): The display format to use
+        """
+        loop = asyncio.get_running_loop()
+        shutdown_signals = (signal.SIGINT, signal.SIGTERM)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                status_task = tg.create_task(
+                    self.check_stream_status(username, broadcaster_id, display_format)
+                )
+                quit_task = tg.create_task(self.listen_for_quit())
+                quit_task.add_done_callback(lambda _: status_task.cancel())
+                for sig in shutdown_signals:
+                    loop.add_signal_handler(sig, self.request_shutdown, status_task, quit_task)
+        except* Exception:  # noqa: BLE001 失敗の種類によらず、記録して正常に終了させるため
+            # 失敗したタスクがあれば記録して、アプリケーションを終了する
+            logger.exception("Monitoring stopped due to an error")
+            self.display_message("An error occurred. Terminating application...")
+        finally:
+            # 監視の終了後はタスクをキャンセルする必要がないため、ハンドラを外す
+            for sig in shutdown_signals:
+                loop.remove_signal_handler(sig)
 
     async def run(self) -> None:
         """Main execution loop of the application
@@ -367,15 +429,14 @@ class StreamNotification(object):
                 username, display_format = await self.input_monitoring_settings()
                 # ストリーマーの存在確認
                 if username and display_format:
-                    if not await self.check_streamer_existence(username, display_format):
+                    if not self.scripts_available(display_format):
+                        return
+                    broadcaster_id = await self.check_streamer_existence(username, display_format)
+                    if not broadcaster_id:
                         return
 
                     # 配信状態の監視を開始
-                    status_task = asyncio.create_task(self.check_stream_status(username, display_format))
-                    self._cleanup_tasks.append(status_task)
-                    quit_task = asyncio.create_task(self.listen_for_quit())
-                    self._cleanup_tasks.append(quit_task)
-                    await asyncio.wait([status_task, quit_task], return_when=asyncio.FIRST_COMPLETED)
+                    await self.monitor_stream(username, broadcaster_id, display_format)
             except (KeyboardInterrupt, asyncio.CancelledError):
                 logger.info("Application shutdown requested")
             finally:
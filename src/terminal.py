@@ -42,10 +42,10 @@ class Terminal(object):
                 "/usr/bin/osascript",
                 script_path,
                 self.base_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            await proc.communicate()
+            await proc.wait()
         except subprocess.SubprocessError:
             logger.exception(traceback.format_exc())
             await self.close_terminal()
@@ -67,10 +67,10 @@ class Terminal(object):
             proc = await asyncio.create_subprocess_exec(
                 "/usr/bin/osascript",
                 script_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            await proc.communicate()
+            await proc.wait()
         except subprocess.SubprocessError:
             logger.exception(traceback.format_exc())
             return
@@ -5,11 +5,15 @@ This module provides an asynchronous client for interacting with the Twitch API.
 """
 
 import asyncio
+import contextlib
 import logging
 import os
+import random
+import time
 from contextlib import asynccontextmanager
+from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout
@@ -21,8 +25,15 @@ logger = logging.getLogger(__name__)
 
 class TwitchAPIError(Exception):
     """Exception raised for errors in the Twitch API client.
+
+    Attributes:
+        retry_after (float | None): Seconds to wait before retrying, if the API specified it.
     """
 
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
 def _write_content(filepath: Path, data: bytes) -> None:
     """Helper function to handle blocking file writes."""
     with open(filepath, "wb") as f:
@@ -43,12 +54,13 @@ class TwitchAPI:
         session (ClientSession): The client session for making requests.
         access_token (str): The access token for the Twitch API.
         _token_lock (asyncio.Lock): A lock for ensuring access token is retrieved or updated safely.
+        _token_task (asyncio.Task | None): The task prefetching the access token.
     """
 
     base_url = "https://api.twitch.tv/helix/"
     timeout = ClientTimeout(total=AppConstant.TIMEOUT_SECONDS)
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the API client.
 
         Attributes:
@@ -57,22 +69,38 @@ class TwitchAPI:
             session (ClientSession): The client session for making requests.
             access_token (str): The access token for the Twitch API.
             _token_lock (asyncio.Lock): A lock for ensuring access token is retrieved or updated safely.
+            _token_task (asyncio.Task | None): The task prefetching the access token.
         """
         self.client_id = CLIENT_ID
         self.client_secret = CLIENT_SECRET
         self.session: ClientSession | None = None
         self.access_token: str | None = None
         self._token_lock = asyncio.Lock()
+        self._token_task: asyncio.Task[None] | None = None
 
     async def initialize(self) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        The access token is fetched in the background, so the caller can prompt the user meanwhile.
+        Requests wait for it through _ensure_access_token.
+        """
         if not self.session:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
-            await self._ensure_access_token()
+            connector = aiohttp.TCPConnector(
+                limit=AppConstant.CONNECTION_LIMIT,
+                ttl_dns_cache=AppConstant.DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=AppConstant.KEEPALIVE_TIMEOUT_SECONDS
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._token_task = asyncio.create_task(self._prefetch_access_token())
 
     async def close(self) -> None:
         """Close the API client.
         """
+        if self._token_task and not self._token_task.done():
+            self._token_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._token_task
+        self._token_task = None
         if self.session:
             await self.session.close()
             self.session = None
@@ -85,6 +113,15 @@ class TwitchAPI:
             if not self.access_token:
                 await self._get_access_token()
 
+    async def _prefetch_access_token(self) -> None:
+        """Fetch the access token ahead of the first request.
+
+        Failures are silently discarded, since the prompt is on screen meanwhile.
+        The first request retries the fetch and its caller reports the error.
+        """
+        with contextlib.suppress(Exception):
+            await self._ensure_access_token()
+
     async def _get_access_token(self) -> None:
         """Get the access token for the Twitch API.
         """
@@ -105,9 +142,9 @@ class TwitchAPI:
                 response.raise_for_status()
                 data = await response.json()
                 self.access_token = data["access_token"]
-        except aiohttp.ClientError as e:
-            logger.exception(AppConstant.ERROR_ACCESS_TOKEN_FAILED)
-            error_msg = f"{AppConstant.ERROR_ACCESS_TOKEN_FAILED}: {str(e)}"
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError) as e:
+            # ログは呼び出し側で出力する(先読み中の失敗で入力画面を乱さないため)
+            error_msg = f"{AppConstant.ERROR_ACCESS_TOKEN_FAILED}: {e!r}"
             raise TwitchAPIError(error_msg) from e
 
     def _get_headers(self) -> dict[str, str]:
@@ -124,7 +161,11 @@ class TwitchAPI:
         }
 
     @asynccontextmanager
-    async def _make_request(self, url: str, query_params: dict[str, Any] | None = None):
+    async def _make_request(
+        self,
+        url: str,
+        query_params: dict[str, Any] | None = None
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
         """Make an API request and yield the response.
         """
         if not self.session:
@@ -134,6 +175,7 @@ class TwitchAPI:
 
         await self._ensure_access_token()
 
+        # ログは呼び出し側で出力する(ポーリング中の失敗ごとにトレースバックを重複して出さないため)
         try:
             async with self.session.get(
                 url,
@@ -141,8 +183,11 @@ class TwitchAPI:
                 params=query_params
             ) as response:
                 yield response
+        except asyncio.TimeoutError as e:
+            # TimeoutErrorはメッセージが空のため、原因が分かるメッセージにする
+            error_msg = f"{AppConstant.ERROR_API_REQUEST_TIMEOUT} ({AppConstant.TIMEOUT_SECONDS}s)"
+            raise TwitchAPIError(error_msg) from e
         except aiohttp.ClientError as e:
-            logger.exception(AppConstant.ERROR_API_REQUEST_FAILED)
             error_msg = f"{AppConstant.ERROR_API_REQUEST_FAILED}: {str(e)}"
             raise TwitchAPIError(error_msg) from e
 
@@ -153,6 +198,12 @@ class TwitchAPI:
     ) -> list[dict[str, Any]] | None:
         """Get the response data from the API."""
         async with self._make_request(url, query_params) as response:
+            if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                # Ratelimit-Resetはバケットが回復する時刻(エポック秒)
+                reset = response.headers.get("Ratelimit-Reset", "")
+                # 時刻のずれやリセット時刻の経過で0秒にならないよう、最低1秒は待つ
+                retry_after = max(int(reset) - time.time(), 1.0) if reset.isdigit() else None
+                raise TwitchAPIError(AppConstant.ERROR_RATE_LIMITED, retry_after=retry_after)
             response.raise_for_status()
             data = await response.json()
             return data.get("data")
@@ -181,36 +232,45 @@ class TwitchAPI:
         self,
         user_id: str
     ) -> tuple[str | None, str | None]:
-        """Get the stream data for a given user ID."""
+        """Get the stream data for a given user ID.
+
+        Raises:
+            TwitchAPIError: An error occurred while requesting the stream data
+        """
         url = self.base_url + "streams"
         query_params = {"user_id": user_id}
 
-        try:
-            stream_data = await self._get_response(url, query_params)
-            if not stream_data:
-                return None, None
-            return self._get_stream_data(stream_data)
-        except TwitchAPIError:
-            logger.exception("Failed to get stream data for user ID %s", user_id)
+        stream_data = await self._get_response(url, query_params)
+        if not stream_data:
             return None, None
+        return self._get_stream_data(stream_data)
 
-    async def get_stream_by_name(
-        self,
-        user_name: str
-    ) -> tuple[str | None, str | None]:
-        """Get the stream data for a given user name.
-        """
-        url = self.base_url + "streams"
-        query_params = {"user_login": user_name}
+    async def stream_events(self, user_id: str) -> AsyncIterator[tuple[str, str]]:
+        """Yield the stream data each time the given user ID is found streaming.
 
-        try:
-            stream_data = await self._get_response(url, query_params)
-            if not stream_data:
-                return None, None
-            return self._get_stream_data(stream_data)
-        except TwitchAPIError:
-            logger.exception("Failed to get stream data for user %s", user_name)
-            return None, None
+        EventSub over WebSocket requires a user access token, so the status is polled with the app token.
+        Failed polls are retried with exponential backoff, waiting at least until Ratelimit-Reset when rate limited.
+        """
+        backoff = AppConstant.CHECK_INTERVAL
+        while True:
+            try:
+                display_name, stream_title = await self.get_stream_by_id(user_id)
+            except TwitchAPIError as e:
+                logger.warning("Failed to get stream data for user ID %s: %s", user_id, e)
+                # ジッターを加えた後に上限を適用する
+                delay = min(backoff * random.uniform(0.8, 1.2), AppConstant.MAX_BACKOFF_INTERVAL)
+                if e.retry_after is not None:
+                    delay = max(e.retry_after, delay)
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, AppConstant.MAX_BACKOFF_INTERVAL)
+                continue
+
+            backoff = AppConstant.CHECK_INTERVAL
+            if display_name and stream_title:
+                yield display_name, stream_title
+                await asyncio.sleep(AppConstant.STREAMING_INTERVAL)
+            else:
+                await asyncio.sleep(AppConstant.CHECK_INTERVAL)
 
     async def download_profile_image(self, image_url: str | None, save_path: Path) -> None:
         """Download the broadcaster's profile image and save it to save_path."""
@@ -223,9 +283,9 @@ class TwitchAPI:
                 response.raise_for_status()
                 content = await response.read()
             await asyncio.to_thread(_write_content, save_path, content)
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.exception("Failed to download profile image.")
-            raise TwitchAPIError(str(e)) from e
+            raise TwitchAPIError(repr(e)) from e
 
     def _get_stream_data(
         self,
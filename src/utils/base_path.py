@@ -8,6 +8,12 @@ import os
 import sys
 from pathlib import Path
 
+# 実行中に変わらないため、インポート時に一度だけ解決しておく
+if "__compiled__" in globals():
+    _BASE_PATH = Path(os.path.dirname(os.path.realpath(sys.argv[0])))
+else:
+    _BASE_PATH = Path(__file__).parent.parent.resolve()
+
 
 def get_base_path() -> Path:
     """Get the base path of the application
@@ -16,6 +22,4 @@ def get_base_path() -> Path:
     Returns:
         Path: The base path of the application
     """
-    if "__compiled__" in globals():
-        return Path(os.path.dirname(os.path.realpath(sys.argv[0])))
-    return Path(__file__).parent.parent.resolve()
+    return _BASE_PATH